@@ -17,14 +17,12 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
 
-from src.state import init_state, add_resume, reset_all
-from src.io_utils import read_any
+# Touched on every rerun -- keep at module scope. The embedding/ranking
+# stack (openai, tiktoken, simsimd transitively) is imported lazily inside
+# compute() so Streamlit reruns don't pay its import tax.
+from src.state import init_state, add_resume, reset_all, text_hash
+from src.io_utils import read_any_stream
 from src.parsing import extract_name
-from src.embeddings.openai_client import OpenAIEmbeddingClient
-from src.ranking import rank_by_cosine
-from src.utils.batching import embed_in_batches
-from src.utils.tokens import count_tokens
-from src.fit_summary import generate_fit_summary
 
 
 
@@ -34,6 +32,13 @@ def compute(jd_text, resumes, top_k=5):
     Compute embeddings for JD + resumes (no NLP preprocessing),
     then rank top_k by cosine similarity.
     """
+    # Deferred: pulls in openai + tiktoken, only needed once the user
+    # actually computes
+    from src.embeddings.openai_client import OpenAIEmbeddingClient
+    from src.embeddings.quantize import quantize_int8
+    from src.ranking import rank_by_cosine
+    from src.utils.batching import embed_in_batches
+    from src.utils.tokens import count_tokens
 
     if not jd_text.strip():
         st.warning("Enter a job description first.")
@@ -54,56 +59,93 @@ def compute(jd_text, resumes, top_k=5):
             return None
 
         # 2) Resumes as-is (skip empties)
-        kept_names = []
-        texts = [jd_raw]  # JD first
+        kept = []
         for r in resumes:
             name = r["name"]
             parsed = (r.get("text") or "").strip()
             if not parsed:
                 st.warning(f"{name}: skipped (empty or unreadable resume).")
                 continue
-            kept_names.append(name)
-            texts.append(parsed)
+            if not r.get("text_hash"):
+                r["text_hash"] = text_hash(parsed)
+            kept.append(r)
 
-        if len(texts) <= 1:
+        if not kept:
             st.error("No usable resumes provided.")
             return None
-
-        # 3) Log size summary
-        labels = ["JD"] + kept_names
-        tok_counts = [count_tokens(t, "text-embedding-3-small") for t in texts]
-        print("\n=== Embedding batch summary ===")
-        print(f"Total texts to embed: {len(texts)}")
-        for i, (lbl, tks) in enumerate(zip(labels, tok_counts)):
-            print(f"{i:02d}. {lbl:>12} | ~{tks} tokens | {len(texts[i])} chars")
-
-        # 4) Embed in safe batches (item & token caps)
-        try:
-            embs = embed_in_batches(
-                backend,
-                texts,
-                model="text-embedding-3-small",
-                max_text_tokens=8191,    
-                max_batch_items=128,     
-                max_batch_tokens=60000,  
-                truncate_long=True,
-                verbose=True,
-            )  
-        except Exception as embed_err:
-            print("Embed call failed:", type(embed_err), repr(embed_err))
-            st.error(f"Embed call failed: {embed_err}")
-            return None
-
-        print(f"\nEmbeddings shape: {getattr(embs, 'shape', None)}")
+        kept_names = [r["name"] for r in kept]
+
+        # 3) Partition into cached vs missing embeddings so re-clicks
+        #    (top-K toggle, one new resume) only embed what changed
+        jd_hash = text_hash(jd_raw)
+        jd_cached = (
+            st.session_state.get("jd_vec") is not None
+            and st.session_state.get("jd_vec_hash") == jd_hash
+        )
+        missing = [
+            r for r in kept
+            if r.get("embedding") is None or r.get("embedding_hash") != r["text_hash"]
+        ]
+
+        texts = ([] if jd_cached else [jd_raw]) + [r["text"].strip() for r in missing]
+        labels = ([] if jd_cached else ["JD"]) + [r["name"] for r in missing]
+
+        if texts:
+            # Log size summary for what actually goes over the wire
+            tok_counts = [count_tokens(t, "text-embedding-3-small") for t in texts]
+            print("\n=== Embedding batch summary ===")
+            print(f"Total texts to embed: {len(texts)} (of {len(kept) + 1} in session)")
+            for i, (lbl, tks) in enumerate(zip(labels, tok_counts)):
+                print(f"{i:02d}. {lbl:>12} | ~{tks} tokens | {len(texts[i])} chars")
+
+            # 4) Embed in safe batches (item & token caps)
+            try:
+                embs = embed_in_batches(
+                    backend,
+                    texts,
+                    model="text-embedding-3-small",
+                    max_text_tokens=8191,
+                    max_batch_items=128,
+                    max_batch_tokens=60000,
+                    truncate_long=True,
+                    verbose=True,
+                )
+            except Exception as embed_err:
+                print("Embed call failed:", type(embed_err), repr(embed_err))
+                st.error(f"Embed call failed: {embed_err}")
+                return None
+
+            print(f"\nEmbeddings shape: {getattr(embs, 'shape', None)}")
+
+            cursor = 0
+            if not jd_cached:
+                st.session_state.jd_vec = embs[0]
+                st.session_state.jd_vec_hash = jd_hash
+                cursor = 1
+            for r in missing:
+                r["embedding"] = embs[cursor]
+                r["embedding_hash"] = r["text_hash"]
+                r["dtype"] = "float32"
+                cursor += 1
+        else:
+            print("\n[cache] All embeddings reused from session state")
 
         # 5) Rank JD vs resumes
-        q_vec = embs[:1]    # (1, D)
-        doc_vecs = embs[1:] # (R, D)
+        q_vec = st.session_state.jd_vec.reshape(1, -1)   # (1, D)
+        doc_vecs = np.stack([r["embedding"] for r in kept])  # (R, D)
         if doc_vecs.size == 0:
             st.error("No vectors produced for resumes.")
             return None
 
-        return rank_by_cosine(q_vec, doc_vecs, kept_names, top_k=top_k, normalize=False)
+        # Quantize to int8 for ranking: 4x less memory/bandwidth per vector
+        # and SimSIMD's i8 kernel when available. Cosine is scale-invariant
+        # so the per-vector quantization scales don't change the ordering.
+        q_i8, _ = quantize_int8(q_vec)
+        d_i8, _ = quantize_int8(doc_vecs)
+        return rank_by_cosine(
+            q_i8, d_i8, kept_names, top_k=top_k, normalize=False,
+            assume_normalized=True,  # embed() returns unit vectors
+        )
 
     except Exception as e:
         print("Embedding failed:", type(e), repr(e))
@@ -146,12 +188,13 @@ def main():
     )
     if uploaded:
         for f in uploaded:
-            file_bytes = f.read()
-            text = read_any(f.name, file_bytes)
+            # Parse straight from the upload buffer; keep the bytes copy
+            # only for resumes we actually store (needed for ZIP export).
+            text = read_any_stream(f.name, f)
             name = extract_name(f.name, len(st.session_state.resumes) + 1)
             # dedupe by name only (user can re-upload with a different name if needed)
             if not any(r["name"].lower() == name.lower() for r in st.session_state.resumes):
-                add_resume(name, text, data=file_bytes, filename=f.name)
+                add_resume(name, text, data=f.getvalue(), filename=f.name)
             else:
                 pass
 
@@ -222,6 +265,7 @@ def main():
                 st.session_state.top_fit_name = None
 
             def _gen():
+                from src.fit_summary import generate_fit_summary  # deferred: imports openai
                 with st.spinner("Generating fit summary…"):
                     st.session_state.top_fit_summary = generate_fit_summary(
                         st.session_state.jd_text,
@@ -256,7 +300,14 @@ def main():
                 fname = r.get("filename")
                 if data and fname:
                     safe = re.sub(r"[^A-Za-z0-9._-]+", "_", fname)
-                    zf.writestr(safe, data)
+                    # PDFs/DOCX are internally compressed already; re-deflating
+                    # burns CPU for ~0% size savings, so store them as-is
+                    ext = Path(fname).suffix.lower()
+                    method = (
+                        zipfile.ZIP_STORED if ext in {".pdf", ".docx", ".zip"}
+                        else zipfile.ZIP_DEFLATED
+                    )
+                    zf.writestr(safe, data, compress_type=method)
                 else:
                     # fallback: write .txt with the parsed/plain text
                     txt = r.get("text", "")
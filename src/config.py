@@ -5,4 +5,8 @@ load_dotenv()  # loads .env if present
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 EMBED_MODEL = os.getenv("EMBED_MODEL", "text-embedding-3-small")
+EMBED_CACHE_PATH = os.getenv(
+    "EMBED_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "candidate-recommender", "embeddings.db"),
+)
 TOP_K_DEFAULT = 5
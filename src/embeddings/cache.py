@@ -0,0 +1,116 @@
+# src/embeddings/cache.py
+import sqlite3
+import threading
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from src.config import EMBED_CACHE_PATH
+from src.utils.hashing import fingerprint
+
+
+def _key(model: str, text: str) -> str:
+    """Content-addressed key: hash of model + NUL + text."""
+    return fingerprint(model + "\x00" + text)
+
+
+class EmbeddingCache:
+    """
+    Persistent content-addressed cache for embedding vectors.
+
+    Vectors are stored as raw float32 bytes in a local sqlite db so a hit is a
+    single indexed lookup + frombuffer (no pickle). If the db can't be opened
+    (read-only host, etc.) the cache degrades to a no-op and every call goes
+    to the backend.
+    """
+
+    def __init__(self, path: str = EMBED_CACHE_PATH):
+        self._lock = threading.Lock()
+        try:
+            import os
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, dim INTEGER NOT NULL, vec BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        except Exception:
+            self._conn = None
+
+    def _get(self, key: str) -> Optional[np.ndarray]:
+        if self._conn is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT dim, vec FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        dim, blob = row
+        return np.frombuffer(blob, dtype=np.float32, count=dim)
+
+    def _put(self, key: str, vec: np.ndarray):
+        if self._conn is None:
+            return
+        vec = np.ascontiguousarray(vec, dtype=np.float32)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, dim, vec) VALUES (?, ?, ?)",
+                (key, vec.shape[0], vec.tobytes()),
+            )
+            self._conn.commit()
+
+    def get_or_compute_many(
+        self,
+        texts: List[str],
+        model: str,
+        compute_batch: Callable[[List[str]], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Return (N, D) float32 vectors for `texts`, calling `compute_batch`
+        only for the cache misses and scattering results back in input order.
+        """
+        keys = [_key(model, t) for t in texts]
+        vecs: List[Optional[np.ndarray]] = [self._get(k) for k in keys]
+        miss = [i for i, v in enumerate(vecs) if v is None]
+
+        if miss:
+            computed = np.asarray(compute_batch([texts[i] for i in miss]), dtype=np.float32)
+            for j, i in enumerate(miss):
+                vecs[i] = computed[j]
+                self._put(keys[i], computed[j])
+
+        if not vecs:
+            return np.empty((0, 0), dtype=np.float32)
+
+        out = np.empty((len(vecs), vecs[0].shape[0]), dtype=np.float32)
+        for i, v in enumerate(vecs):
+            out[i] = v
+        return out
+
+    async def aget_or_compute_many(
+        self,
+        texts: List[str],
+        model: str,
+        compute_batch: Callable[[List[str]], "np.ndarray"],
+    ) -> np.ndarray:
+        """Same as get_or_compute_many but awaits an async compute_batch."""
+        keys = [_key(model, t) for t in texts]
+        vecs: List[Optional[np.ndarray]] = [self._get(k) for k in keys]
+        miss = [i for i, v in enumerate(vecs) if v is None]
+
+        if miss:
+            computed = np.asarray(await compute_batch([texts[i] for i in miss]), dtype=np.float32)
+            for j, i in enumerate(miss):
+                vecs[i] = computed[j]
+                self._put(keys[i], computed[j])
+
+        if not vecs:
+            return np.empty((0, 0), dtype=np.float32)
+
+        out = np.empty((len(vecs), vecs[0].shape[0]), dtype=np.float32)
+        for i, v in enumerate(vecs):
+            out[i] = v
+        return out
@@ -1,8 +1,25 @@
+import asyncio
+import base64
 import numpy as np
 from typing import List
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from src.config import OPENAI_API_KEY, EMBED_MODEL
 from .base import EmbeddingClient
+from .cache import EmbeddingCache
+
+def _response_to_array(resp) -> np.ndarray:
+    # With encoding_format="base64" each embedding arrives as raw
+    # little-endian float32 bytes: frombuffer decodes it in one pass
+    # instead of materializing 1536 Python floats per vector. Keep the
+    # list path for SDK versions that hand back decoded floats anyway.
+    first = resp.data[0].embedding
+    if isinstance(first, str):
+        return np.stack([
+            np.frombuffer(base64.b64decode(d.embedding), dtype=np.float32)
+            for d in resp.data
+        ])
+    return np.array([d.embedding for d in resp.data], dtype=np.float32)
+
 
 class OpenAIEmbeddingClient(EmbeddingClient):
     def __init__(self, api_key: str = OPENAI_API_KEY, model: str = EMBED_MODEL):
@@ -11,9 +28,42 @@ class OpenAIEmbeddingClient(EmbeddingClient):
         self.api_key = api_key            # <-- keep a copy for logging
         self.client = OpenAI(api_key=api_key)
         self.model = model
+        self.cache = EmbeddingCache()
+
+    def _embed_api(self, texts: List[str]) -> np.ndarray:
+        resp = self.client.embeddings.create(
+            model=self.model, input=texts, encoding_format="base64",
+        )
+        return _response_to_array(resp)
 
     def embed(self, texts: List[str]) -> np.ndarray:
-        resp = self.client.embeddings.create(model=self.model, input=texts)
-        arr = np.array([d.embedding for d in resp.data], dtype=np.float32)
+        # Cache hits skip the API entirely; only the miss list goes over the wire.
+        arr = self.cache.get_or_compute_many(texts, self.model, self._embed_api)
+        norms = np.linalg.norm(arr, axis=1, keepdims=True) + 1e-10
+        return arr / norms
+
+
+class AsyncOpenAIEmbeddingClient(EmbeddingClient):
+    """Async variant so embed_in_batches can fire batches concurrently."""
+
+    def __init__(self, api_key: str = OPENAI_API_KEY, model: str = EMBED_MODEL):
+        if not api_key:
+            raise RuntimeError("OPENAI_API_KEY not set. Put it in a .env or export it.")
+        self.api_key = api_key
+        self.client = AsyncOpenAI(api_key=api_key)
+        self.model = model
+        self.cache = EmbeddingCache()
+
+    async def _embed_api(self, texts: List[str]) -> np.ndarray:
+        resp = await self.client.embeddings.create(
+            model=self.model, input=texts, encoding_format="base64",
+        )
+        return _response_to_array(resp)
+
+    async def embed_async(self, texts: List[str]) -> np.ndarray:
+        arr = await self.cache.aget_or_compute_many(texts, self.model, self._embed_api)
         norms = np.linalg.norm(arr, axis=1, keepdims=True) + 1e-10
         return arr / norms
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        return asyncio.run(self.embed_async(texts))
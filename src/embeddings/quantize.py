@@ -0,0 +1,22 @@
+# src/embeddings/quantize.py
+from typing import Tuple
+import numpy as np
+
+def quantize_int8(vecs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetric per-vector int8 quantization.
+
+    4x smaller than float32 (1.5 KB vs 6 KB per 1536-D vector) and eligible
+    for SimSIMD's i8 cosine kernel. Returns (int8 (N, D), float32 (N, 1)
+    scales). Cosine similarity is scale-invariant, so ranking on the int8
+    vectors directly gives the same ordering; the scales are only needed to
+    recover the original values.
+    """
+    vecs = np.asarray(vecs, dtype=np.float32)
+    peak = np.max(np.abs(vecs), axis=1, keepdims=True)
+    scale = 127.0 / (peak + 1e-10)
+    q = np.clip(np.round(vecs * scale), -127, 127).astype(np.int8)
+    return q, scale.astype(np.float32)
+
+def dequantize_int8(q: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    return q.astype(np.float32) / scale
@@ -1,7 +1,8 @@
+import asyncio
 import os
-from typing import Optional
+from typing import List, Optional
 
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from src.utils.tokens import count_tokens
 
 LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4o-mini")
@@ -10,6 +11,9 @@ LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4o-mini")
 MAX_JD_TOKENS = 1200
 MAX_RESUME_TOKENS = 2200
 
+# concurrent summary calls (keeps us under OpenAI TPM limits)
+MAX_CONCURRENT_SUMMARIES = 5
+
 def _truncate_to_tokens(text: str, max_tokens: int, model: str) -> str:
     if not text:
         return ""
@@ -21,15 +25,14 @@ def _truncate_to_tokens(text: str, max_tokens: int, model: str) -> str:
     approx_chars = max(512, int(len(text) * ratio * 0.5) * 2)
     return text[:approx_chars]
 
-def generate_fit_summary(jd_text: str, resume_text: str, role_title: Optional[str] = None) -> str:
-    """
-    Return a concise, evidence-based summary explaining why the candidate fits the JD.
-    """
+def _require_api_key() -> str:
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY not set")
-    client = OpenAI(api_key=api_key)
+    return api_key
+
 
+def _build_messages(jd_text: str, resume_text: str, role_title: Optional[str] = None) -> list:
     # We use the embedding model for token counting heuristic; the LLM can be different.
     jd_trim = _truncate_to_tokens(jd_text, MAX_JD_TOKENS, "text-embedding-3-small")
     resume_trim = _truncate_to_tokens(resume_text, MAX_RESUME_TOKENS, "text-embedding-3-small")
@@ -57,13 +60,22 @@ Then 2-3 bullet points mapping JD requirements to resume evidence (skills, tools
 
 """
 
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": user},
+    ]
+
+
+def generate_fit_summary(jd_text: str, resume_text: str, role_title: Optional[str] = None) -> str:
+    """
+    Return a concise, evidence-based summary explaining why the candidate fits the JD.
+    """
+    client = OpenAI(api_key=_require_api_key())
+
     # Call the LLM
     resp = client.chat.completions.create(
         model=LLM_MODEL,
-        messages=[
-            {"role": "system", "content": system},
-            {"role": "user", "content": user},
-        ],
+        messages=_build_messages(jd_text, resume_text, role_title),
         temperature=0.3,
         max_tokens=350,
     )
@@ -72,6 +84,46 @@ Then 2-3 bullet points mapping JD requirements to resume evidence (skills, tools
     return resp.choices[0].message.content.strip()
 
 
+async def agenerate_fit_summary(
+    jd_text: str,
+    resume_text: str,
+    role_title: Optional[str] = None,
+    client: Optional[AsyncOpenAI] = None,
+) -> str:
+    """Async variant of generate_fit_summary, for fanning out over candidates."""
+    client = client or AsyncOpenAI(api_key=_require_api_key())
+    resp = await client.chat.completions.create(
+        model=LLM_MODEL,
+        messages=_build_messages(jd_text, resume_text, role_title),
+        temperature=0.3,
+        max_tokens=350,
+    )
+    return resp.choices[0].message.content.strip()
+
+
+def generate_fit_summaries(
+    jd_text: str,
+    resume_texts: List[str],
+    role_title: Optional[str] = None,
+) -> List[str]:
+    """
+    Summaries for several candidates in parallel: K network-bound LLM calls
+    take ~1 RTT instead of K, bounded by MAX_CONCURRENT_SUMMARIES.
+    """
+    client = AsyncOpenAI(api_key=_require_api_key())
+
+    async def _run():
+        sem = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIES)
+
+        async def _one(resume_text: str) -> str:
+            async with sem:
+                return await agenerate_fit_summary(jd_text, resume_text, role_title, client=client)
+
+        return await asyncio.gather(*(_one(t) for t in resume_texts))
+
+    return list(asyncio.run(_run()))
+
+
 
     
 
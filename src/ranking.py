@@ -19,24 +19,71 @@ def rank_by_cosine(query_vec: np.ndarray, doc_vecs: np.ndarray, names, top_k: in
 import numpy as np
 import pandas as pd
 
+try:
+    import simsimd  # SIMD cosine kernels (AVX2/AVX-512/NEON)
+    _HAS_SIMSIMD = True
+    _nb_cosine_top_k = None
+except Exception:
+    _HAS_SIMSIMD = False
+    try:
+        # Second-choice kernel where simsimd wheels don't exist
+        from .ranking_numba import cosine_top_k as _nb_cosine_top_k
+    except Exception:
+        _nb_cosine_top_k = None
+
 def l2norm(x, eps=1e-10):
     norms = np.linalg.norm(x, axis=1, keepdims=True) + eps
     return x / norms
 
-def rank_by_cosine(q_vec, doc_vecs, names, top_k=5, normalize=False):
-    # L2-normalize
-    qn = l2norm(q_vec)
-    dn = l2norm(doc_vecs)
+def rank_by_cosine(q_vec, doc_vecs, names, top_k=5, normalize=False, assume_normalized=False):
+    # assume_normalized: OpenAIEmbeddingClient.embed already returns unit
+    # vectors, so callers can skip the two O(N*D) renormalization passes
+    # here. Ignored for int8 input (quantization changes the norms) and in
+    # the simsimd path (its cosine normalizes internally either way).
+    q_vec = np.ascontiguousarray(q_vec)
+    doc_vecs = np.ascontiguousarray(doc_vecs)
+    is_int8 = q_vec.dtype == np.int8 and doc_vecs.dtype == np.int8
 
-    # cosine with the single JD vector
-    scores = (dn @ qn.T).ravel()  # shape (R,)
+    order = None
+    if _HAS_SIMSIMD:
+        # simsimd's cosine distance normalizes internally, so skip the
+        # two O(N*D) l2norm passes and convert distance -> similarity.
+        # int8 inputs hit the i8 kernel (VNNI dot products where the CPU
+        # has them); per-vector quantization scales cancel out in cosine.
+        if not is_int8:
+            q_vec = q_vec.astype(np.float32, copy=False)
+            doc_vecs = doc_vecs.astype(np.float32, copy=False)
+        scores = 1.0 - np.asarray(simsimd.cdist(q_vec, doc_vecs, metric="cosine")).ravel()
+    else:
+        # Fallback: L2-normalize (unless already unit norm), then cosine
+        # is a plain dot product
+        q32 = q_vec.astype(np.float32, copy=False)
+        d32 = doc_vecs.astype(np.float32, copy=False)
+        if assume_normalized and not is_int8:
+            qn, dn = q32, d32
+        else:
+            qn, dn = l2norm(q32), l2norm(d32)
+        if _nb_cosine_top_k is not None:
+            # Early-abort kernel: stops accumulating a row once it can no
+            # longer reach the current k-th best score.
+            order, scores = _nb_cosine_top_k(qn, dn, top_k)
+        else:
+            scores = (dn @ qn.T).ravel()  # shape (R,)
 
     if normalize:
         maxv = np.max(scores) if scores.size else 1.0
         if maxv > 0:
             scores = scores / maxv
 
-    order = np.argsort(-scores)[:top_k]
+    if order is None:
+        # Partition out the top-k (O(R)) and sort just those k (O(k log k))
+        # instead of argsorting all R scores.
+        k = min(top_k, scores.size)
+        if k > 0:
+            idx = np.argpartition(-scores, k - 1)[:k]
+            order = idx[np.argsort(-scores[idx])]
+        else:
+            order = np.empty(0, dtype=np.intp)
     df = pd.DataFrame({
         "Candidate": [names[i] for i in order],
         "Similarity": [float(scores[i]) for i in order],
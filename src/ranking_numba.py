@@ -0,0 +1,87 @@
+# src/ranking_numba.py
+# Numba-jitted cosine kernel, used by src/ranking.py when simsimd wheels
+# are unavailable (musl/ARM32 hosts). Expects pre-normalized float32 input
+# so cosine reduces to a dot product; LLVM auto-vectorizes the inner loop.
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def cosine_scores(q, D):
+    n = D.shape[0]
+    d = D.shape[1]
+    out = np.empty(n, dtype=np.float32)
+    for i in prange(n):
+        s = 0.0
+        for j in range(d):
+            s += q[0, j] * D[i, j]
+        out[i] = s
+    return out
+
+
+_BLOCK = 64
+
+
+@njit(fastmath=True, cache=True)
+def top_k_shortcircuit(q, D, k):
+    """
+    Top-k dot products with early abort, after nmslib's batched
+    short-circuit trick. Accumulates in 64-dim blocks; once k candidates
+    are in, a row is abandoned as soon as the optimistic bound
+    partial + ||q[j:]|| (valid because ||doc|| = 1, Cauchy-Schwarz) falls
+    below the current k-th best score. Aborted rows keep a -2 sentinel,
+    which is below any true cosine. Serial on purpose: the threshold is
+    shared state.
+    """
+    n, d = D.shape
+    nblocks = (d + _BLOCK - 1) // _BLOCK
+
+    # Suffix norms of the query, per block boundary
+    suffix = np.empty(nblocks + 1, dtype=np.float32)
+    suffix[nblocks] = 0.0
+    for b in range(nblocks - 1, -1, -1):
+        s = 0.0
+        for j in range(b * _BLOCK, min(d, (b + 1) * _BLOCK)):
+            s += q[0, j] * q[0, j]
+        suffix[b] = suffix[b + 1] + s
+    for b in range(nblocks + 1):
+        suffix[b] = np.sqrt(suffix[b])
+
+    scores = np.full(n, -2.0, dtype=np.float32)
+    best = np.full(k, -2.0, dtype=np.float32)
+    thresh = -2.0
+
+    for i in range(n):
+        partial = 0.0
+        alive = True
+        for b in range(nblocks):
+            if partial + suffix[b] <= thresh:
+                alive = False
+                break
+            for j in range(b * _BLOCK, min(d, (b + 1) * _BLOCK)):
+                partial += q[0, j] * D[i, j]
+        if alive:
+            scores[i] = partial
+            if partial > best[0]:  # best[0] holds the k-th best so far
+                best[0] = partial
+                mn = 0
+                for m in range(1, k):
+                    if best[m] < best[mn]:
+                        mn = m
+                if mn != 0:
+                    best[0], best[mn] = best[mn], best[0]
+                thresh = best[0]
+    return scores
+
+
+def cosine_top_k(q, D, k):
+    """Return (top-k indices best-first, all scores) for one query row."""
+    q = np.ascontiguousarray(q, dtype=np.float32)
+    D = np.ascontiguousarray(D, dtype=np.float32)
+    k = min(k, D.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+    scores = top_k_shortcircuit(q, D, k)
+    idx = np.argpartition(-scores, k - 1)[:k]
+    order = idx[np.argsort(-scores[idx])]
+    return order, scores
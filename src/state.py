@@ -1,22 +1,37 @@
 import streamlit as st
 from src.io_utils import normalize_whitespace
+from src.utils.hashing import fingerprint
+
+def text_hash(text: str) -> str:
+    """Fingerprint used for dedup and to validate cached embeddings."""
+    return fingerprint(text)
 
 def init_state():
     st.session_state.setdefault("resumes", [])  # list[dict]: {name, text}
     st.session_state.setdefault("jd_text", "")
     st.session_state.setdefault("results", None)
     st.session_state.setdefault("paste_resume", "")
+    st.session_state.setdefault("jd_vec", None)       # cached JD embedding
+    st.session_state.setdefault("jd_vec_hash", None)  # text_hash it belongs to
 
 def add_resume(name: str, text: str, data: bytes | None = None, filename: str | None = None):
     text = normalize_whitespace(text)
-    # de-dupe by exact name
-    if any(r["name"].lower() == name.lower() for r in st.session_state.resumes):
+    content_hash = text_hash(text)
+    # de-dupe by exact name or identical content
+    if any(
+        r["name"].lower() == name.lower() or r.get("text_hash") == content_hash
+        for r in st.session_state.resumes
+    ):
         return
     st.session_state.resumes.append({
         "name": name,
         "text": text,
-        "data": data,         
-        "filename": filename,  
+        "data": data,
+        "filename": filename,
+        "text_hash": content_hash,
+        "embedding": None,       # filled in by compute(), reused across clicks
+        "embedding_hash": None,  # text_hash the embedding was computed from
+        "dtype": None,           # storage dtype of the cached embedding
     })
 
 def reset_all():
@@ -24,4 +39,6 @@ def reset_all():
     st.session_state["jd_text"] = ""
     st.session_state["results"] = None
     st.session_state["paste_resume"] = ""
+    st.session_state["jd_vec"] = None
+    st.session_state["jd_vec_hash"] = None
     st.rerun()
